@@ -43,9 +43,34 @@ async for row in database.execute(...):
     print(row)
 await database.disconnect()
 ```
+# Shared engines
+Instances with the same settings share their engine, which is not disposed
+by `disconnect()`. Dispose shared engines upon shutdown, before the event loop
+is closed:
+```
+await dispose_async_engines()
+```
+# Faster JSON serialization
+Install the `orjson` extra to serialize JSON columns with orjson. Output
+matches the standard library, except that it has no whitespace between items,
+NaN and Infinity become `null` and enums are serialized by value:
+```
+pip install sqlalchemy-boilerplate[orjson]
+```
 """
 
-from .boilerplate import AsyncBoilerplate, Boilerplate
+from .boilerplate import (
+    AsyncBoilerplate,
+    Boilerplate,
+    dispose_async_engines,
+    dispose_engines,
+)
 from .common import BASE
 
-__all__ = ["BASE", "AsyncBoilerplate", "Boilerplate"]
+__all__ = [
+    "BASE",
+    "AsyncBoilerplate",
+    "Boilerplate",
+    "dispose_async_engines",
+    "dispose_engines",
+]
@@ -2,26 +2,338 @@
 Defines the major class provided by the package:
  - Boilerplate: SQL database abstraction class.
  - AsyncBoilerplate: SQL database abstraction class with async methods
+ - dispose_engines: disposes engines shared by Boilerplate instances
+ - dispose_async_engines: disposes engines shared by AsyncBoilerplate
+   instances
 """
 
+import asyncio
+import contextlib
+import contextvars
+import dataclasses
+import functools
+import itertools
 import json
 import logging
-from typing import AsyncGenerator, Generator, Union
+import threading
+import time
+from typing import (
+    AsyncContextManager,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse
 
-from sqlalchemy import create_engine
-from sqlalchemy.exc import OperationalError, SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+import asyncpg
+from sqlalchemy import Engine, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
-from sqlalchemy.sql import text
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+from sqlalchemy.sql import TextClause, text
 
 from .common import BASE
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
+# Engines shared across instances, together with their session factory,
+# keyed by URL and engine arguments. Async engines are bound to the event
+# loop they were created in, hence they are kept apart per loop. Pooled
+# connections reference their loop, so entries of closed loops are dropped
+# explicitly, see _async_engine_cache()
+_ENGINE_CACHE: Dict[tuple, Tuple[Engine, sessionmaker]] = {}
+_ASYNC_ENGINE_CACHE: Dict[
+    asyncio.AbstractEventLoop, Dict[tuple, Tuple[AsyncEngine, sessionmaker]]
+] = {}
+_ENGINE_CACHE_LOCK = threading.RLock()
+
+# Connection of the transaction opened by AsyncBoilerplate.transaction() in
+# the current context, reused by the query methods
+_CURRENT_CONNECTION: contextvars.ContextVar[Optional[AsyncConnection]] = contextvars.ContextVar(
+    "sqlalchemy_boilerplate_connection", default=None
+)
+
+
+def _json_dumps(obj) -> str:
+    """Serializes obj to JSON using the standard library"""
+    return json.dumps(obj, ensure_ascii=False, default=str)
+
+
+def _orjson_dumps(obj) -> str:
+    """
+    Serializes obj to JSON using orjson. Dates, times and dataclasses go
+    through str() like with the standard library. Objects orjson can not
+    encode (e.g. integers beyond 64 bits) are left to the standard library.
+    Unlike the standard library, output has no whitespace, NaN and Infinity
+    become null and enums are serialized by value
+    """
+    try:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS,
+        ).decode()
+    except orjson.JSONEncodeError:
+        return _json_dumps(obj)
+
+
+# orjson is optional, see the "orjson" extra
+_json_serializer = _json_dumps if orjson is None else _orjson_dumps
+
+
+@functools.lru_cache(maxsize=256)
+def _text(query: str) -> TextClause:
+    """Returns a TextClause for the query, reusing it for repeated queries"""
+    return text(query)
+
+
+@dataclasses.dataclass(frozen=True)
+class _EngineConfig:  # pylint: disable=too-many-instance-attributes
+    """Arguments passed to create_engine. Unset (None) ones are left to SQLAlchemy"""
+
+    echo: bool = False
+    json_serializer: Callable = _json_serializer
+    query_cache_size: Optional[int] = None
+    poolclass: Optional[type] = None
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    pool_pre_ping: Optional[bool] = None
+    pool_recycle: Optional[int] = None
+    connect_args: Optional[dict] = None
+
+    def to_kwargs(self) -> dict:
+        """Returns the arguments which are set, as keyword arguments"""
+        return {
+            field.name: getattr(self, field.name)
+            for field in dataclasses.fields(self)
+            if getattr(self, field.name) is not None
+        }
+
+
+def _hashable(value):
+    """Returns value if it is hashable, its representation otherwise"""
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _shared_engine(
+    cache: dict, factory: Callable, url: str, engine_kwargs: dict, class_: type
+) -> Tuple[Union[Engine, AsyncEngine], sessionmaker, bool]:
+    """
+    Returns the engine cached for url and engine_kwargs, its session factory
+    and whether they were just created
+    """
+    key = (url, tuple(sorted((name, _hashable(value)) for name, value in engine_kwargs.items())))
+    with _ENGINE_CACHE_LOCK:
+        entry = cache.get(key)
+        if entry is not None:
+            return (*entry, False)
+
+        engine = factory(url, **engine_kwargs)
+        entry = cache[key] = (
+            engine,
+            sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=class_),
+        )
+    return (*entry, True)
+
+
+def dispose_engines() -> None:
+    """Disposes the engines shared by Boilerplate instances"""
+    with _ENGINE_CACHE_LOCK:
+        engines = list(_ENGINE_CACHE.values())
+        _ENGINE_CACHE.clear()
+
+    for engine, _ in engines:
+        engine.dispose()
+
+
+def _async_engine_cache() -> Dict[tuple, Tuple[AsyncEngine, sessionmaker]]:
+    """
+    Returns the shared engines of the running event loop. Engines of closed
+    loops are dropped: their connections can no longer be closed, so the pool
+    only releases them to the garbage collector
+    """
+    with _ENGINE_CACHE_LOCK:
+        for loop in [loop for loop in _ASYNC_ENGINE_CACHE if loop.is_closed()]:
+            for engine, _ in _ASYNC_ENGINE_CACHE.pop(loop).values():
+                engine.sync_engine.dispose(close=False)
+        return _ASYNC_ENGINE_CACHE.setdefault(asyncio.get_running_loop(), {})
+
+
+async def dispose_async_engines() -> None:
+    """
+    Disposes the engines shared by AsyncBoilerplate instances within the
+    running event loop. Must be called before the loop is closed, as engines
+    of closed loops can no longer close their connections
+    """
+    with _ENGINE_CACHE_LOCK:
+        engines = list(_async_engine_cache().values())
+        del _ASYNC_ENGINE_CACHE[asyncio.get_running_loop()]
+
+    for engine, _ in engines:
+        await engine.dispose()
+
+
+def _warmup_size(engine: Union[Engine, AsyncEngine], warmup: int) -> int:
+    """
+    Returns how many connections can be pre-opened in the pool of engine.
+    Only queue pools keep connections, and only up to their size
+    """
+    if isinstance(engine.pool, QueuePool):
+        return min(warmup, engine.pool.size())
+    return 0
+
+
+def _current_connection(engine: AsyncEngine) -> Optional[AsyncConnection]:
+    """
+    Returns the connection of the transaction opened in the current context
+    for engine, if it is still open. Tasks created within the transaction
+    inherit the context and may outlive it
+    """
+    connection = _CURRENT_CONNECTION.get()
+    if (
+        connection is not None
+        and connection.engine is engine
+        and not connection.closed
+        and connection.in_transaction()
+    ):
+        return connection
+    return None
+
+
+@contextlib.asynccontextmanager
+async def _reuse(connection: AsyncConnection) -> AsyncIterator[AsyncConnection]:
+    """Yields an already open connection, leaving it open on exit"""
+    yield connection
+
+
+def _batched(iterable: Iterable, size: int) -> Generator[list, None, None]:
+    """Yields lists of up to size items from iterable"""
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def _with_driver(url: str, drivername: str) -> str:
+    """Returns url with its scheme replaced by drivername"""
+    # urlunparse() drops the "//" of URLs without host, e.g. "sqlite://"
+    return make_url(url).set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def _is_sqlite_file(url: str) -> bool:
+    """Returns whether url points to a file-backed SQLite database"""
+    parsed_url = make_url(url)
+    return (
+        parsed_url.get_backend_name() == "sqlite"
+        and parsed_url.database not in (None, "", ":memory:")
+        and parsed_url.query.get("mode") != "memory"
+    )
+
+
+# Arguments for asyncpg connections, either created by SQLAlchemy or by the
+# raw pool. Keepalives prevent idle connections from being silently dropped
+_ASYNCPG_CONNECT_ARGS = {
+    "statement_cache_size": 500,
+    "server_settings": {"tcp_keepalives_idle": "60", "tcp_keepalives_interval": "10"},
+}
+
+
+def _build_pg(url: str, pool_kwargs: dict) -> Tuple[str, dict]:
+    """Returns URL and engine arguments for PostgreSQL"""
+    return url, dict(pool_kwargs)
+
+
+# We only need SQLite for unittest, but we're going to make it a
+# first class citizen anyway
+def _build_sqlite(url: str, pool_kwargs: dict) -> Tuple[str, dict]:
+    """Returns URL and engine arguments for SQLite"""
+    # pylint: disable=unused-argument
+    extra_kwargs = {"connect_args": {"check_same_thread": False}}
+    # StaticPool is needed when SQLite is ran in memory
+    if not _is_sqlite_file(url):
+        extra_kwargs["poolclass"] = StaticPool
+    return url, extra_kwargs
 
-class Boilerplate:
+
+def _build_async_pg(url: str, pool_kwargs: dict) -> Tuple[str, dict]:
+    """Returns URL and engine arguments for PostgreSQL with asyncpg"""
+    return _with_driver(url, "postgresql+asyncpg"), {
+        "poolclass": AsyncAdaptedQueuePool,
+        "connect_args": {"prepared_statement_cache_size": 500, **_ASYNCPG_CONNECT_ARGS},
+        **pool_kwargs,
+    }
+
+
+def _build_async_sqlite(url: str, pool_kwargs: dict) -> Tuple[str, dict]:
+    """Returns URL and engine arguments for SQLite with aiosqlite"""
+    _, extra_kwargs = _build_sqlite(url, pool_kwargs)
+    return _with_driver(url, "sqlite+aiosqlite"), extra_kwargs
+
+
+_SCHEME_HANDLERS = {"postgresql": _build_pg, "sqlite": _build_sqlite}
+_ASYNC_SCHEME_HANDLERS = {"postgresql": _build_async_pg, "sqlite": _build_async_sqlite}
+
+
+def _dispatch_url(handlers: dict, url: str, pool_kwargs: dict) -> Tuple[str, dict]:
+    """Returns URL and engine arguments from the handler matching the URL scheme"""
+    parsed_url = urlparse(url)
+    handler = handlers.get(parsed_url.scheme.lower())
+    if handler is None:
+        error = 'Database can be either "sqlite" or "postgresql", ' f'not: "{parsed_url.scheme}"'
+        raise ValueError(error)
+    return handler(url, pool_kwargs)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Tunes file-backed SQLite connections for concurrent reads"""
+    # pylint: disable=unused-argument
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def _create_engine(url: str, **engine_kwargs) -> Engine:
+    """Creates an engine, tuning SQLite connections if the database is a file"""
+    engine = create_engine(url, **engine_kwargs)
+    if _is_sqlite_file(url):
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+def _create_async_engine(url: str, **engine_kwargs) -> AsyncEngine:
+    """Creates an async engine, tuning SQLite connections if the database is a file"""
+    engine = create_async_engine(url, **engine_kwargs)
+    if _is_sqlite_file(url):
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+class Boilerplate:  # pylint: disable=too-many-instance-attributes
     """
     SQL database abstraction class. Allows users to create, read and delete
     tasks and results.
@@ -33,42 +345,70 @@ class Boilerplate:
     create_tables: whether create SQL tables or not
     session: Session object used to connect to the DB. By default a new one
              is created
+    pool_size: number of connections kept open in the pool (PostgreSQL only)
+    max_overflow: connections allowed beyond pool_size (PostgreSQL only)
+    pool_pre_ping: whether test connections for liveness upon checkout
+                   (PostgreSQL only)
+    pool_recycle: seconds after which a connection is recycled (PostgreSQL only)
+    warmup: number of connections opened upon connection, so that they are
+            ready in the pool before the first query. Capped to the pool
+            size, as overflow connections are not kept. Default: 0
+    query_cache_size: size of the cache used for compiled SQL statements
+    owns_engine: whether the instance creates and disposes its own engine.
+                 By default engines are shared by instances with the same
+                 settings and are not disposed upon disconnection, see
+                 dispose_engines(). In-memory SQLite engines are never shared
+    engine: engine used to connect to the DB, e.g. one shared by the whole
+            application. It is not disposed by the instance, nor cached
+            module-wide, and owns_engine is ignored. By default one is created
 
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         url: str,
         echo: bool = False,
         create_tables: bool = False,
         session: Union[bool, Session] = False,
+        pool_size: int = 20,
+        max_overflow: int = 30,
+        pool_pre_ping: bool = True,
+        pool_recycle: int = 1800,
+        warmup: int = 0,
+        query_cache_size: int = 1200,
+        owns_engine: bool = False,
+        engine: Optional[Engine] = None,
     ) -> None:
-        parsed_url = urlparse(url)
         self.__create_tables = create_tables
-        self.__engine_kwargs = {
-            "echo": echo,
-            "json_serializer": lambda obj: json.dumps(obj, ensure_ascii=False, default=str),
-        }
-        # We only need SQLite for unittest, but we're going to make it a
-        # first class citizen anyway
-        if parsed_url.scheme.lower() == "postgresql":
-            self.url = url
-        elif parsed_url.scheme.lower() == "sqlite":
-            self.url = url
-            # StaticPool is needed when SQLite is ran in memory
-            self.__engine_kwargs["poolclass"] = StaticPool
-            self.__engine_kwargs["connect_args"] = {"check_same_thread": False}
-        else:
-            error = (
-                'Database can be either "sqlite" or "postgresql", ' f'not: "{parsed_url.scheme}"'
-            )
-            raise ValueError(error)
+        if warmup < 0:
+            raise ValueError("Warmup can not be negative")
+        self.__warmup = warmup
+        self.__external_engine = engine
+        self.url, extra_kwargs = _dispatch_url(
+            _SCHEME_HANDLERS,
+            url,
+            {
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "pool_pre_ping": pool_pre_ping,
+                "pool_recycle": pool_recycle,
+            },
+        )
+        self.__engine_config = _EngineConfig(
+            echo=echo, query_cache_size=query_cache_size, **extra_kwargs
+        )
+        # In-memory SQLite databases live as long as their engine, sharing it
+        # would share the database as well
+        self.__owns_engine = (
+            owns_engine or self.__engine_config.poolclass is StaticPool
+        ) and engine is None
 
         if session is True:
             raise ValueError("Session can be either false or AsyncSession")
 
         self.session = session or None
         self.engine = None
+        self.__result_cache: Dict[str, Tuple[float, tuple]] = {}
 
     def __enter__(self):
         self.connect()
@@ -96,24 +436,34 @@ class Boilerplate:
 
         LOGGER.info("Connecting to database")
 
-        try:
-            self.engine = create_engine(self.url, **self.__engine_kwargs)
-
-            # Create tables if requested
-            if self.__create_tables:
-                BASE.metadata.create_all(bind=self.engine)
-
+        # Only new engines are warmed up, others may be in use already
+        if self.__external_engine is not None or self.__owns_engine:
+            if self.__external_engine is not None:
+                self.engine, created = self.__external_engine, False
+            else:
+                self.engine = _create_engine(self.url, **self.__engine_config.to_kwargs())
+                created = True
             session = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        else:
+            self.engine, session, created = _shared_engine(
+                _ENGINE_CACHE, _create_engine, self.url, self.__engine_config.to_kwargs(), Session
+            )
 
-            self.session = session()
-        except SQLAlchemyError as error:
-            LOGGER.error(error)
-            raise error from error
+        # Create tables if requested
+        if self.__create_tables:
+            BASE.metadata.create_all(bind=self.engine)
+
+        # Pre-open connections. They must be held at the same time,
+        # otherwise the pool keeps handing back the same one
+        connections = []
+        try:
+            for _ in range(_warmup_size(self.engine, self.__warmup) if created else 0):
+                connections.append(self.engine.connect())
         finally:
-            try:
-                self.session.close()
-            except AttributeError:
-                pass
+            for connection in connections:
+                connection.close()
+
+        self.session = session()
 
         return self.session
 
@@ -122,12 +472,12 @@ class Boilerplate:
         if self.session:
             self.session.close()
 
-        if self.engine:
+        if self.engine and self.__owns_engine:
             self.engine.dispose()
 
         LOGGER.info("Disconnected from database")
 
-    def execute(self, query: str) -> Generator[tuple, str, None]:
+    def execute(self, query: str, batch_size: int = 1000) -> Generator[tuple, str, None]:
         """
         Executes a query and yeild rows
 
@@ -136,18 +486,104 @@ class Boilerplate:
         ----------
         query: str
             Query to be executed
+        batch_size: int
+            Number of rows fetched from the server at once. Default: 1000
 
         Returns:
         --------
         Generator[tuple, str, None]: Result rows
         """
-        query = text(query)
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive")
+
+        query = _text(query)
         with self.engine.begin() as connection:
-            with connection.execution_options(stream_results=True).execute(query) as rows:
+            connection = connection.execution_options(stream_results=True, yield_per=batch_size)
+            with connection.execute(query) as rows:
                 yield from rows
 
+    def execute_chunks(self, query: str, size: int = 1000) -> Generator[list, str, None]:
+        """
+        Executes a query and yeild chunks of rows
+
+
+        Arguments:
+        ----------
+        query: str
+            Query to be executed
+        size: int
+            Maximum number of rows per chunk. Default: 1000
+
+        Returns:
+        --------
+        Generator[list, str, None]: Lists of result rows
+        """
+        query = _text(query)
+        with self.engine.begin() as connection:
+            connection = connection.execution_options(stream_results=True, yield_per=size)
+            with connection.execute(query) as rows:
+                yield from rows.partitions(size)
+
+    def execute_many(self, query: str, params: Iterable[dict], batch_size: int = 1000) -> None:
+        """
+        Executes a query once per set of parameters, sending them in batches
+        within a single transaction
+
+
+        Arguments:
+        ----------
+        query: str
+            Query to be executed
+        params: Iterable[dict]
+            Parameters to bind to the query
+        batch_size: int
+            Number of parameter sets sent at once. Default: 1000
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive")
+
+        query = _text(query)
+        with self.engine.begin() as connection:
+            for batch in _batched(params, batch_size):
+                connection.execute(query, batch)
+
+    def cached_execute(self, query: str, ttl: float = 30) -> List[tuple]:
+        """
+        Executes a query and returns all rows, caching them for ttl seconds
+
 
-class AsyncBoilerplate:
+        Arguments:
+        ----------
+        query: str
+            Query to be executed
+        ttl: float
+            Seconds the rows are cached for. Default: 30
+
+        Returns:
+        --------
+        List[tuple]: Result rows
+        """
+        now = time.monotonic()
+        try:
+            expires, rows = self.__result_cache[query]
+            if now < expires:
+                return list(rows)
+        except KeyError:
+            pass
+
+        rows = list(self.execute(query))
+        # Drop expired rows, then cache a copy the caller can not alter
+        for key in [key for key, (expires, _) in self.__result_cache.items() if expires <= now]:
+            del self.__result_cache[key]
+        self.__result_cache[query] = (now + ttl, tuple(rows))
+        return rows
+
+    def clear_cache(self) -> None:
+        """Empties the cache used by cached_execute"""
+        self.__result_cache.clear()
+
+
+class AsyncBoilerplate:  # pylint: disable=too-many-instance-attributes
     """
     SQL database abstraction class. Allows users to create, read and delete
     tasks and results. All methods are async.
@@ -159,41 +595,84 @@ class AsyncBoilerplate:
     create_tables: whether create SQL tables or not
     session: Session object used to connect to the DB. By default a new one
              is created
+    pool_size: number of connections kept open in the pool (PostgreSQL only)
+    max_overflow: connections allowed beyond pool_size (PostgreSQL only)
+    pool_pre_ping: whether test connections for liveness upon checkout
+                   (PostgreSQL only)
+    pool_recycle: seconds after which a connection is recycled (PostgreSQL only)
+    warmup: number of connections opened upon connection, so that they are
+            ready in the pool before the first query. Capped to the pool
+            size, as overflow connections are not kept. Default: 0
+    query_cache_size: size of the cache used for compiled SQL statements
+    owns_engine: whether the instance creates and disposes its own engine.
+                 By default engines are shared by instances with the same
+                 settings and are not disposed upon disconnection, see
+                 dispose_async_engines(). In-memory SQLite engines are never shared
+    engine: engine used to connect to the DB, e.g. one shared by the whole
+            application. It is not disposed by the instance, nor cached
+            module-wide, and owns_engine is ignored. By default one is created
+    raw_pool: whether create an asyncpg pool, sized after pool_size and
+              max_overflow, to be used by execute_raw (PostgreSQL only)
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         url: str,
         echo: bool = False,
         create_tables: bool = False,
         session: Union[bool, AsyncSession] = False,
+        pool_size: int = 20,
+        max_overflow: int = 30,
+        pool_pre_ping: bool = True,
+        pool_recycle: int = 1800,
+        warmup: int = 0,
+        query_cache_size: int = 1200,
+        owns_engine: bool = False,
+        raw_pool: bool = False,
+        engine: Optional[AsyncEngine] = None,
     ) -> None:
         self.__create_tables = create_tables
-        self.__engine_kwargs = {
-            "echo": echo,
-            "json_serializer": lambda obj: json.dumps(obj, ensure_ascii=False, default=str),
-        }
-        # We only need SQLite for unittest, but we're going to make it a
-        # first class citizen anyway
-        parsed_url = urlparse(url)
-        if parsed_url.scheme.lower() == "postgresql":
-            self.url = f"postgresql+asyncpg://{url[13:]}"
-        elif parsed_url.scheme.lower() == "sqlite":
-            self.url = f"sqlite+aiosqlite://{url[9:]}"
-            # StaticPool is needed when SQLite is ran in memory
-            self.__engine_kwargs["poolclass"] = StaticPool
-            self.__engine_kwargs["connect_args"] = {"check_same_thread": False}
-        else:
-            error = (
-                'Database can be either "sqlite" or "postgresql", ' f'not: "{parsed_url.scheme}"'
-            )
-            raise ValueError(error)
+        if warmup < 0:
+            raise ValueError("Warmup can not be negative")
+        self.__warmup = warmup
+        self.__external_engine = engine
+        self.url, extra_kwargs = _dispatch_url(
+            _ASYNC_SCHEME_HANDLERS,
+            url,
+            {
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "pool_pre_ping": pool_pre_ping,
+                "pool_recycle": pool_recycle,
+            },
+        )
+        self.__engine_config = _EngineConfig(
+            echo=echo, query_cache_size=query_cache_size, **extra_kwargs
+        )
+        # In-memory SQLite databases live as long as their engine, sharing it
+        # would share the database as well
+        self.__owns_engine = (
+            owns_engine or self.__engine_config.poolclass is StaticPool
+        ) and engine is None
+
+        self.__raw_pool_kwargs = None
+        if raw_pool:
+            if urlparse(url).scheme.lower() != "postgresql":
+                raise ValueError("Raw pool is only available for PostgreSQL")
+            self.__raw_pool_kwargs = {
+                "dsn": url,
+                "min_size": pool_size,
+                "max_size": pool_size + max_overflow,
+                **_ASYNCPG_CONNECT_ARGS,
+            }
 
         if session is True:
             raise ValueError("Session can be either false or AsyncSession")
 
         self.session = session or None
         self.engine = None
+        self.raw_pool = None
+        self.__result_cache: Dict[str, Tuple[float, tuple]] = {}
 
     async def __aenter__(self):
         await self.connect()
@@ -215,48 +694,111 @@ class AsyncBoilerplate:
         force: bool
             Force reconnection even if a session exists already. Default: False
         """
+        # The raw pool does not depend on the session, which may be given
         if self.session:
             if not force:
+                await self.__create_raw_pool()
                 return self.session
 
         LOGGER.info("Connecting to database")
 
-        try:
-            self.engine = create_async_engine(self.url, **self.__engine_kwargs)
-
-            # Create tables if requested
-            if self.__create_tables:
-                try:
-                    async with self.engine.begin() as connection:
-                        await connection.run_sync(BASE.metadata.create_all)
-                    LOGGER.info("Connected to database")
-                except OperationalError as error:
-                    LOGGER.error(error)
-                    raise RuntimeError(error) from error
-
+        # Only new engines are warmed up, others may be in use already
+        if self.__external_engine is not None or self.__owns_engine:
+            if self.__external_engine is not None:
+                self.engine, created = self.__external_engine, False
+            else:
+                self.engine = _create_async_engine(self.url, **self.__engine_config.to_kwargs())
+                created = True
             make_session = sessionmaker(
                 autocommit=False, autoflush=False, bind=self.engine, class_=AsyncSession
             )
+        else:
+            self.engine, make_session, created = _shared_engine(
+                _async_engine_cache(),
+                _create_async_engine,
+                self.url,
+                self.__engine_config.to_kwargs(),
+                AsyncSession,
+            )
 
-        except SQLAlchemyError as error:
-            LOGGER.error(error)
-            raise error from error
+        # Create tables if requested
+        if self.__create_tables:
+            async with self.engine.begin() as connection:
+                await connection.run_sync(BASE.metadata.create_all)
+            LOGGER.info("Connected to database")
+
+        # Pre-open connections concurrently
+        connections = await asyncio.gather(
+            *(
+                self.engine.connect().start()
+                for _ in range(_warmup_size(self.engine, self.__warmup) if created else 0)
+            ),
+            return_exceptions=True,
+        )
+        errors = [error for error in connections if isinstance(error, BaseException)]
+        for connection in connections:
+            if not isinstance(connection, BaseException):
+                await connection.close()
+        if errors:
+            raise errors[0]
 
         self.session = make_session()
 
+        # Created last, so that it is not left open if connecting fails
+        await self.__create_raw_pool()
+
         return self.session
 
+    async def __create_raw_pool(self) -> None:
+        """Creates the raw pool, if enabled and not created yet"""
+        if self.__raw_pool_kwargs and self.raw_pool is None:
+            self.raw_pool = await asyncpg.create_pool(**self.__raw_pool_kwargs)
+
     async def disconnect(self):
         """Safely disconnect the database"""
         if self.session:
             await self.session.close()
 
-        if self.engine:
+        if self.engine and self.__owns_engine:
             await self.engine.dispose()
 
+        if self.raw_pool:
+            await self.raw_pool.close()
+            self.raw_pool = None
+
         LOGGER.info("Disconnected from database")
 
-    async def execute(self, query: str) -> AsyncGenerator[tuple, str]:
+    @contextlib.asynccontextmanager
+    async def transaction(self) -> AsyncIterator[AsyncConnection]:
+        """
+        Opens a transaction that is reused by the query methods called within
+        the context, so that they share one connection and one BEGIN/COMMIT.
+        Queries must be consumed one at a time, as they share the connection
+
+        Returns:
+        --------
+        AsyncIterator[AsyncConnection]: Connection of the transaction
+        """
+        connection = _current_connection(self.engine)
+        if connection is not None:
+            yield connection
+            return
+
+        async with self.engine.begin() as connection:
+            token = _CURRENT_CONNECTION.set(connection)
+            try:
+                yield connection
+            finally:
+                _CURRENT_CONNECTION.reset(token)
+
+    def __begin(self) -> AsyncContextManager[AsyncConnection]:
+        """Reuses the transaction of the current context, or begins a new one"""
+        connection = _current_connection(self.engine)
+        if connection is not None:
+            return _reuse(connection)
+        return self.engine.begin()
+
+    async def execute(self, query: str, batch_size: int = 1000) -> AsyncGenerator[tuple, str]:
         """
         Executes a query and yeild rows
 
@@ -265,12 +807,130 @@ class AsyncBoilerplate:
         ----------
         query: str
             Query to be executed
+        batch_size: int
+            Number of rows fetched from the server at once. Default: 1000
 
         Returns:
         --------
         AsyncGenerator[tuple, str]: Result rows
         """
-        query = text(query)
-        async with self.engine.begin() as connection:
-            async for row in await connection.stream(query):
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive")
+
+        query = _text(query)
+        async with self.__begin() as connection:
+            rows = await connection.stream(
+                query, execution_options={"stream_results": True, "yield_per": batch_size}
+            )
+            async for row in rows:
                 yield row
+
+    async def execute_raw(self, query: str, *args) -> AsyncGenerator[tuple, str]:
+        """
+        Executes a query straight through asyncpg, bypassing SQLAlchemy, and
+        yeild rows. Requires raw_pool to be enabled
+
+
+        Arguments:
+        ----------
+        query: str
+            Query to be executed, with asyncpg style placeholders ($1, $2, ...)
+        args:
+            Query arguments
+
+        Returns:
+        --------
+        AsyncGenerator[tuple, str]: Result rows
+        """
+        if self.raw_pool is None:
+            raise RuntimeError("Raw pool is not available, enable raw_pool and connect first")
+
+        async with self.raw_pool.acquire() as connection:
+            # Cursors can only be used within a transaction
+            async with connection.transaction():
+                async for record in connection.cursor(query, *args):
+                    yield tuple(record)
+
+    async def execute_chunks(self, query: str, size: int = 1000) -> AsyncGenerator[list, str]:
+        """
+        Executes a query and yeild chunks of rows
+
+
+        Arguments:
+        ----------
+        query: str
+            Query to be executed
+        size: int
+            Maximum number of rows per chunk. Default: 1000
+
+        Returns:
+        --------
+        AsyncGenerator[list, str]: Lists of result rows
+        """
+        query = _text(query)
+        async with self.__begin() as connection:
+            rows = await connection.stream(
+                query, execution_options={"stream_results": True, "yield_per": size}
+            )
+            async for chunk in rows.partitions(size):
+                yield chunk
+
+    async def execute_many(
+        self, query: str, params: Iterable[dict], batch_size: int = 1000
+    ) -> None:
+        """
+        Executes a query once per set of parameters, sending them in batches
+        within a single transaction
+
+
+        Arguments:
+        ----------
+        query: str
+            Query to be executed
+        params: Iterable[dict]
+            Parameters to bind to the query
+        batch_size: int
+            Number of parameter sets sent at once. Default: 1000
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive")
+
+        query = _text(query)
+        async with self.__begin() as connection:
+            for batch in _batched(params, batch_size):
+                await connection.execute(query, batch)
+
+    async def cached_execute(self, query: str, ttl: float = 30) -> List[tuple]:
+        """
+        Executes a query and returns all rows, caching them for ttl seconds
+
+
+        Arguments:
+        ----------
+        query: str
+            Query to be executed
+        ttl: float
+            Seconds the rows are cached for. Default: 30
+
+        Returns:
+        --------
+        List[tuple]: Result rows
+        """
+        now = time.monotonic()
+        try:
+            expires, rows = self.__result_cache[query]
+            if now < expires:
+                return list(rows)
+        except KeyError:
+            pass
+
+        rows = [row async for row in self.execute(query)]
+        # Drop expired rows, then cache a copy the caller can not alter
+        for key in [key for key, (expires, _) in self.__result_cache.items() if expires <= now]:
+            del self.__result_cache[key]
+        self.__result_cache[query] = (now + ttl, tuple(rows))
+        return rows
+
+    def clear_cache(self) -> None:
+        """Empties the cache used by cached_execute"""
+        self.__result_cache.clear()